@@ -1,69 +1,142 @@
+import argparse
+import io
 import random
+import sys
 import time
+from contextlib import redirect_stdout
+from typing import Final, Optional
+from weather_monitoring.interfaces import Observer
 from weather_monitoring.station import WeatherStation
 from weather_monitoring.factory import ObserverFactory
+from weather_monitoring.observers import (
+    WeatherDisplay,
+    TemperatureAlert,
+    WindSpeedAlert,
+    HumidityAlert,
+)
 
 
-def run_simulation() -> None:
+# Measurements for the opening weeks, shared by every simulation run
+FIXED_MEASUREMENTS: Final[dict[int, tuple[float, float, float]]] = {
+    1: (28.0, 70.0, 12.0),
+    2: (30.0, 72.0, 15.0),
+    3: (32.0, 74.0, 18.0),
+}
+
+
+def run_simulation(
+    weeks: int = 20,
+    seed: Optional[int] = None,
+    tick_seconds: float = 0.0,
+    use_factory: bool = True,
+) -> None:
     """
     Run the weather monitoring simulation.
     
     This simulation demonstrates the Observer pattern by creating a weather
-    station and dynamically adding/removing observers over 20 weeks.
+    station and dynamically adding/removing observers over a number of weeks.
+
+    Args:
+        weeks: Number of weeks to simulate
+        seed: Seed for the random measurements, or None for a random run.
+            A fixed seed (e.g. 0) always produces the same trace.
+        tick_seconds: Delay between weeks in seconds, 0 for no delay
+        use_factory: Create observers through ObserverFactory, or construct
+            the observer classes directly when False
     """
     station = WeatherStation()
 
-    # Use factory to create observers
-    display = ObserverFactory.create_display()
+    # Pre-create observers with specific thresholds to match example
+    display: Observer
+    temp_alert: Observer
+    wind_alert: Observer
+    humidity_alert: Observer
+    if use_factory:
+        display = ObserverFactory.create_display()
+        temp_alert = ObserverFactory.create_temperature_alert(threshold=32.0)
+        wind_alert = ObserverFactory.create_wind_speed_alert()
+        humidity_alert = ObserverFactory.create_humidity_alert(threshold=85.0)
+    else:
+        display = WeatherDisplay()
+        temp_alert = TemperatureAlert(threshold=32.0)
+        wind_alert = WindSpeedAlert()
+        humidity_alert = HumidityAlert(threshold=85.0)
+
     station.register_observer(display)
 
-    # Pre-create observers with specific thresholds to match example
-    temp_alert = ObserverFactory.create_temperature_alert(threshold=32.0)
-    wind_alert = ObserverFactory.create_wind_speed_alert()
-    humidity_alert = ObserverFactory.create_humidity_alert(threshold=85.0)
+    # Weekly schedule of observer changes
+    add_schedule: dict[int, tuple[Observer, ...]] = {
+        4: (temp_alert,),
+        5: (wind_alert,),
+        6: (humidity_alert,),
+    }
+    remove_schedule: dict[int, tuple[Observer, ...]] = {8: (humidity_alert,)}
+
+    # Draw the random measurements for the remaining weeks before the loop starts.
+    # Whole-degree ints are valid float measurements, so no float() cast is needed.
+    randint = random.Random(seed).randint
+    measurements = [
+        FIXED_MEASUREMENTS.get(week)
+        or (randint(20, 45), randint(40, 95), randint(10, 35))
+        for week in range(1, weeks + 1)
+    ]
 
-    # Simulation settings
-    weeks = 20
+    next_tick = time.monotonic()
+    for week, (t, h, w) in enumerate(measurements, start=1):
+        # Collect the whole week in memory and emit it with a single write
+        week_output = io.StringIO()
+        with redirect_stdout(week_output):
+            print(f"Week {week}:")
 
-    for week in range(1, weeks + 1):
-        print(f"Week {week}:")
+            for observer in add_schedule.get(week, ()):
+                print(f"Adding: {type(observer).__name__}")
+                station.register_observer(observer)
 
-        # Dynamic Adding logic based on week number
-        if week == 4:
-            print("Adding: TemperatureAlert")
-            station.register_observer(temp_alert)
+            # Update Station (this triggers all notifications). Force it so the
+            # weekly report is printed even if a random reading repeats.
+            station.set_measurements(t, h, w, force=True)
 
-        if week == 5:
-            print("Adding: WindSpeedAlert")
-            station.register_observer(wind_alert)
+            # Dynamic Removing logic - AFTER measurements
+            for observer in remove_schedule.get(week, ()):
+                print(f"Removing: {type(observer).__name__}")
+                station.remove_observer(observer)
 
-        if week == 6:
-            print("Adding: HumidityAlert")
-            station.register_observer(humidity_alert)
+            print("---")
 
-        # Set measurements based on week
-        if week == 1:
-            t, h, w = 28.0, 70.0, 12.0
-        elif week == 2:
-            t, h, w = 30.0, 72.0, 15.0
-        elif week == 3:
-            t, h, w = 32.0, 74.0, 18.0
-        else:
-            t = float(random.randint(20, 45))
-            h = float(random.randint(40, 95))
-            w = float(random.randint(10, 35))
+        sys.stdout.write(week_output.getvalue())
+        if tick_seconds:
+            # Sleep until the next tick so time spent on the week is not added
+            next_tick += tick_seconds
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
 
-        # Update Station (this triggers all notifications)
-        station.set_measurements(t, h, w)
 
-        # Dynamic Removing logic - AFTER measurements
-        if week == 8:
-            print("Removing: HumidityAlert")
-            station.remove_observer(humidity_alert)
+def main() -> None:
+    """Parse command-line arguments and run the interactive simulation."""
+    parser = argparse.ArgumentParser(
+        description="Run the weather monitoring simulation."
+    )
+    parser.add_argument(
+        "--weeks", type=int, default=20, help="number of weeks to simulate"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="seed for reproducible runs"
+    )
+    parser.add_argument(
+        "--no-factory",
+        action="store_true",
+        help="construct observers directly instead of using ObserverFactory",
+    )
+    args = parser.parse_args()
 
-        print("---")
-        time.sleep(0.1)
+    run_simulation(
+        weeks=args.weeks,
+        seed=args.seed,
+        tick_seconds=0.1,
+        use_factory=not args.no_factory,
+    )
 
 
 if __name__ == "__main__":
-    run_simulation()
\ No newline at end of file
+    main()
@@ -1,406 +1,657 @@
-import unittest
-from io import StringIO
-import sys
+from collections.abc import Callable
 from typing import Optional
+
+import pytest
+
 from weather_monitoring.station import WeatherStation
+from weather_monitoring.interfaces import Measurement, Observer
 from weather_monitoring.observers import (
+    BaseThresholdAlert,
     WeatherDisplay,
     TemperatureAlert,
     WindSpeedAlert,
     HumidityAlert,
 )
+from weather_monitoring import factory
 from weather_monitoring.factory import ObserverFactory
+from main import run_simulation
 
 
-class TestWeatherStation(unittest.TestCase):
-    def setUp(self) -> None:
-        self.station = WeatherStation()
+class RecordingObserver:
+    """Test observer that records the last update and counts notifications."""
 
-    def test_observer_registration_and_notification(self) -> None:
-        """Test that registered observers receive updates."""
+    __slots__ = ("data", "count")
 
-        class MockObserver:
-            def __init__(self) -> None:
-                self.data: Optional[tuple[float, float, float]] = None
+    def __init__(self) -> None:
+        self.data: Optional[Measurement] = None
+        self.count = 0
 
-            def update(self, t: float, h: float, w: float) -> None:
-                self.data = (t, h, w)
+    def update(self, measurement: Measurement) -> None:
+        self.count += 1
+        self.data = measurement
 
-        observer = MockObserver()
-        self.station.register_observer(observer)
 
-        self.station.set_measurements(25.0, 60.0, 10.0)
-        self.assertEqual(observer.data, (25.0, 60.0, 10.0))
+@pytest.fixture
+def station() -> WeatherStation:
+    return WeatherStation()
 
-    def test_remove_observer(self) -> None:
-        """Test that removed observers do not receive updates."""
 
-        class MockObserver:
-            def __init__(self) -> None:
-                self.call_count = 0
+@pytest.fixture(scope="module")
+def display() -> WeatherDisplay:
+    # WeatherDisplay is stateless, so one instance serves every test
+    return WeatherDisplay()
 
-            def update(self, t: float, h: float, w: float) -> None:
-                self.call_count += 1
 
-        observer = MockObserver()
-        self.station.register_observer(observer)
-        self.station.set_measurements(10, 10, 10)
-        self.assertEqual(observer.call_count, 1)
-
-        self.station.remove_observer(observer)
-        self.station.set_measurements(20, 20, 20)
-        self.assertEqual(observer.call_count, 1)
+class TestWeatherStation:
+    def test_observer_registration_and_notification(
+        self, station: WeatherStation
+    ) -> None:
+        """Test that registered observers receive updates."""
+        observer = RecordingObserver()
+        station.register_observer(observer)
 
-    def test_duplicate_observer_registration(self) -> None:
-        """Test that same observer cannot be registered twice."""
+        station.set_measurements(25.0, 60.0, 10.0)
+        assert observer.data == (25.0, 60.0, 10.0)
 
-        class MockObserver:
-            def __init__(self) -> None:
-                self.call_count = 0
+    def test_remove_observer(self, station: WeatherStation) -> None:
+        """Test that removed observers do not receive updates."""
+        observer = RecordingObserver()
+        station.register_observer(observer)
+        station.set_measurements(10, 10, 10)
+        assert observer.count == 1
 
-            def update(self, t: float, h: float, w: float) -> None:
-                self.call_count += 1
+        station.remove_observer(observer)
+        station.set_measurements(20, 20, 20)
+        assert observer.count == 1
 
-        observer = MockObserver()
-        self.station.register_observer(observer)
-        self.station.register_observer(observer)
+    def test_duplicate_observer_registration(self, station: WeatherStation) -> None:
+        """Test that same observer cannot be registered twice."""
+        observer = RecordingObserver()
+        station.register_observer(observer)
+        station.register_observer(observer)
 
-        self.station.set_measurements(10, 10, 10)
-        self.assertEqual(observer.call_count, 1)
+        station.set_measurements(10, 10, 10)
+        assert observer.count == 1
 
-    def test_multiple_observers(self) -> None:
+    def test_multiple_observers(self, station: WeatherStation) -> None:
         """Test that multiple observers all receive notifications."""
+        observers = [RecordingObserver() for _ in range(3)]
+        for observer in observers:
+            station.register_observer(observer)
 
-        class MockObserver:
-            def __init__(self) -> None:
-                self.data: Optional[tuple[float, float, float]] = None
-
-            def update(self, t: float, h: float, w: float) -> None:
-                self.data = (t, h, w)
-
-        obs1 = MockObserver()
-        obs2 = MockObserver()
-        obs3 = MockObserver()
-
-        self.station.register_observer(obs1)
-        self.station.register_observer(obs2)
-        self.station.register_observer(obs3)
-
-        self.station.set_measurements(30.0, 70.0, 15.0)
-
-        self.assertEqual(obs1.data, (30.0, 70.0, 15.0))
-        self.assertEqual(obs2.data, (30.0, 70.0, 15.0))
-        self.assertEqual(obs3.data, (30.0, 70.0, 15.0))
-
-    def test_invalid_temperature_too_low(self) -> None:
-        """Test that temperature below -100°C raises ValueError."""
-        with self.assertRaises(ValueError) as context:
-            self.station.set_measurements(-101.0, 50.0, 10.0)
-        self.assertIn("Temperature", str(context.exception))
-
-    def test_invalid_temperature_too_high(self) -> None:
-        """Test that temperature above 100°C raises ValueError."""
-        with self.assertRaises(ValueError) as context:
-            self.station.set_measurements(101.0, 50.0, 10.0)
-        self.assertIn("Temperature", str(context.exception))
-
-    def test_invalid_humidity_too_low(self) -> None:
-        """Test that negative humidity raises ValueError."""
-        with self.assertRaises(ValueError) as context:
-            self.station.set_measurements(25.0, -1.0, 10.0)
-        self.assertIn("Humidity", str(context.exception))
-
-    def test_invalid_humidity_too_high(self) -> None:
-        """Test that humidity above 100% raises ValueError."""
-        with self.assertRaises(ValueError) as context:
-            self.station.set_measurements(25.0, 101.0, 10.0)
-        self.assertIn("Humidity", str(context.exception))
-
-    def test_invalid_wind_speed_negative(self) -> None:
-        """Test that negative wind speed raises ValueError."""
-        with self.assertRaises(ValueError) as context:
-            self.station.set_measurements(25.0, 50.0, -1.0)
-        self.assertIn("Wind speed", str(context.exception))
-
-    def test_valid_boundary_values(self) -> None:
-        """Test that boundary values are accepted."""
-        # Should not raise any exceptions
-        self.station.set_measurements(-100.0, 0.0, 0.0)
-        self.station.set_measurements(100.0, 100.0, 0.0)
-        self.station.set_measurements(0.0, 50.0, 200.0)
+        station.set_measurements(30.0, 70.0, 15.0)
 
+        for observer in observers:
+            assert observer.data == (30.0, 70.0, 15.0)
 
-class TestWeatherDisplay(unittest.TestCase):
-    def test_display_output_format(self) -> None:
-        """Test that display shows correct format without decimal points."""
+    def test_notification_follows_registration_order(
+        self, station: WeatherStation, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that observers are notified in the order they registered."""
+        alert = TemperatureAlert(threshold=0.0)
         display = WeatherDisplay()
+        station.register_observer(alert)
+        station.register_observer(display)
+        # Re-registering must not move the observer to the end
+        station.register_observer(alert)
 
-        captured_output = StringIO()
-        sys.stdout = captured_output
-
-        display.update(25.5, 65.3, 12.8)
-
-        sys.stdout = sys.__stdout__
-        output = captured_output.getvalue()
+        station.set_measurements(25.0, 60.0, 10.0)
+        lines = capsys.readouterr().out.splitlines()
+
+        assert [line.split(":")[0] for line in lines] == [
+            "TemperatureAlert",
+            "WeatherDisplay",
+        ]
+
+    @pytest.mark.parametrize(
+        "temperature, humidity, wind_speed, field",
+        [
+            (-101.0, 50.0, 10.0, "Temperature"),
+            (101.0, 50.0, 10.0, "Temperature"),
+            (25.0, -1.0, 10.0, "Humidity"),
+            (25.0, 101.0, 10.0, "Humidity"),
+            (25.0, 50.0, -1.0, "Wind speed"),
+        ],
+    )
+    def test_invalid_measurements(
+        self,
+        station: WeatherStation,
+        temperature: float,
+        humidity: float,
+        wind_speed: float,
+        field: str,
+    ) -> None:
+        """Test that out-of-range measurements raise ValueError naming the field."""
+        with pytest.raises(ValueError, match=field):
+            station.set_measurements(temperature, humidity, wind_speed)
+
+    @pytest.mark.parametrize(
+        "temperature, humidity, wind_speed",
+        [(-100.0, 0.0, 0.0), (100.0, 100.0, 0.0), (0.0, 50.0, 200.0)],
+    )
+    def test_valid_boundary_values(
+        self,
+        station: WeatherStation,
+        temperature: float,
+        humidity: float,
+        wind_speed: float,
+    ) -> None:
+        """Test that boundary values are accepted."""
+        # Should not raise any exceptions
+        station.set_measurements(temperature, humidity, wind_speed)
+
+    def test_unchanged_measurements_skip_notification(
+        self, station: WeatherStation
+    ) -> None:
+        """Test that repeating the current measurements does not notify."""
+        observer = RecordingObserver()
+        station.register_observer(observer)
+
+        # The first reading notifies even though it equals the initial zeros
+        station.set_measurements(0.0, 0.0, 0.0)
+        station.set_measurements(0.0, 0.0, 0.0)
+        assert observer.count == 1
+
+        station.set_measurements(0.0, 0.0, 0.0, force=True)
+        assert observer.count == 2
+
+        station.set_measurements(0.0, 0.0, 1.0)
+        assert observer.count == 3
+
+    def test_repeated_reading_reaches_new_observer(
+        self, station: WeatherStation
+    ) -> None:
+        """Test that an observer registered late still gets a repeated reading."""
+        first = RecordingObserver()
+        station.register_observer(first)
+        station.set_measurements(20.0, 50.0, 10.0)
+
+        late = RecordingObserver()
+        station.register_observer(late)
+        station.set_measurements(20.0, 50.0, 10.0)
+        assert (first.count, late.count) == (1, 1)
+        assert late.data == (20.0, 50.0, 10.0)
+
+        station.set_measurements(20.0, 50.0, 10.0)
+        assert (first.count, late.count) == (1, 1)
+
+    def test_observer_removed_mid_notify_is_skipped(
+        self, station: WeatherStation
+    ) -> None:
+        """Test that an observer removed by an earlier one is not called."""
+        second = RecordingObserver()
+
+        class RemovingObserver(RecordingObserver):
+            __slots__ = ()
+
+            def update(self, measurement: Measurement) -> None:
+                super().update(measurement)
+                station.remove_observer(second)
+
+        first = RemovingObserver()
+        station.register_observer(first)
+        station.register_observer(second)
+
+        station.set_measurements(20.0, 50.0, 10.0)
+        assert (first.count, second.count) == (1, 0)
+
+    def test_observer_reregistered_mid_notify_waits_for_next(
+        self, station: WeatherStation
+    ) -> None:
+        """Test that a removed and re-registered observer is notified once."""
+        second = RecordingObserver()
+
+        class ReregisteringObserver(RecordingObserver):
+            __slots__ = ()
+
+            def update(self, measurement: Measurement) -> None:
+                super().update(measurement)
+                station.remove_observer(second)
+                station.register_observer(second)
+
+        first = ReregisteringObserver()
+        station.register_observer(first)
+        station.register_observer(second)
+
+        station.set_measurements(20.0, 50.0, 10.0)
+        assert (first.count, second.count) == (1, 0)
+
+        # The repeated reading reaches only the re-registered, pending observer
+        station.set_measurements(20.0, 50.0, 10.0)
+        assert (first.count, second.count) == (1, 1)
+
+        station.set_measurements(20.0, 50.0, 10.0)
+        assert (first.count, second.count) == (1, 1)
+
+    def test_interests_filter_notifications(self, station: WeatherStation) -> None:
+        """Test that observers with interests only hear about those fields."""
+
+        class WindObserver(RecordingObserver):
+            __slots__ = ()
+            interests = frozenset({"wind_speed"})
+
+        wind_observer = WindObserver()
+        observer = RecordingObserver()
+        station.register_observer(wind_observer)
+        station.register_observer(observer)
+
+        station.set_measurements(20.0, 50.0, 10.0)
+        station.set_measurements(25.0, 55.0, 10.0)
+        assert (wind_observer.count, observer.count) == (1, 2)
+
+        station.set_measurements(25.0, 55.0, 12.0)
+        assert (wind_observer.count, observer.count) == (2, 3)
+
+        # Forced updates reach every observer
+        station.set_measurements(25.0, 55.0, 12.0, force=True)
+        assert (wind_observer.count, observer.count) == (3, 4)
+
+    def test_observer_can_change_registrations_during_notify(
+        self, station: WeatherStation
+    ) -> None:
+        """Test that update() may register and remove observers safely."""
+        late = RecordingObserver()
+
+        class SelfRemovingObserver(RecordingObserver):
+            __slots__ = ()
+
+            def update(self, measurement: Measurement) -> None:
+                super().update(measurement)
+                station.remove_observer(self)
+                station.register_observer(late)
+
+        first = SelfRemovingObserver()
+        station.register_observer(first)
+
+        station.set_measurements(20.0, 50.0, 10.0)
+        assert (first.count, late.count) == (1, 0)
+
+        station.set_measurements(25.0, 55.0, 12.0)
+        assert (first.count, late.count) == (1, 1)
+
+    @pytest.mark.parametrize(
+        "bad_interests, error, match",
+        [
+            (frozenset({"temp"}), ValueError, "Unknown measurement fields"),
+            ("temperature", TypeError, "collection of field names"),
+        ],
+    )
+    def test_invalid_interests_rejected(
+        self,
+        station: WeatherStation,
+        bad_interests: object,
+        error: type[Exception],
+        match: str,
+    ) -> None:
+        """Test that misspelled or bare-string interests fail at registration."""
+
+        class BadObserver(RecordingObserver):
+            __slots__ = ()
+            interests = bad_interests
+
+        observer = BadObserver()
+
+        with pytest.raises(error, match=match):
+            station.register_observer(observer)
+
+        station.set_measurements(20.0, 50.0, 10.0)
+        assert observer.count == 0
+
+    @pytest.mark.parametrize(
+        "alert, first, second, expected",
+        [
+            (
+                TemperatureAlert(threshold=32.0),
+                (35.0, 50.0, 10.0),
+                (35.0, 60.0, 10.0),
+                "TemperatureAlert: **Alert! Temperature exceeded 32°C: 35°C**\n",
+            ),
+            (
+                HumidityAlert(threshold=85.0),
+                (20.0, 90.0, 10.0),
+                (25.0, 90.0, 10.0),
+                "HumidityAlert: **Alert! Humidity exceeded 85%: 90%**\n",
+            ),
+        ],
+    )
+    def test_new_alert_is_notified_despite_interests(
+        self,
+        station: WeatherStation,
+        alert: BaseThresholdAlert,
+        first: tuple[float, float, float],
+        second: tuple[float, float, float],
+        expected: str,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test that a late alert hears the next reading even if its field held."""
+        station.set_measurements(*first)
+        station.register_observer(alert)
+
+        # Only fields outside the alert's interests change here
+        station.set_measurements(*second)
+        assert capsys.readouterr().out == expected
+
+        # Once notified, further changes outside its interests are filtered
+        station.set_measurements(*first)
+        assert capsys.readouterr().out == ""
+
+    def test_run_batch_notifies_each_measurement(
+        self, station: WeatherStation
+    ) -> None:
+        """Test that a batch notifies observers once per measurement, in order."""
+        observer = RecordingObserver()
+        station.register_observer(observer)
+
+        station.run_batch([(20.0, 50.0, 10.0), (25.0, 55.0, 12.0)])
+
+        assert observer.count == 2
+        assert observer.data == (25.0, 55.0, 12.0)
+
+    def test_run_batch_validates_before_notifying(
+        self, station: WeatherStation
+    ) -> None:
+        """Test that an invalid batch entry is reported before any update."""
+        observer = RecordingObserver()
+        station.register_observer(observer)
+
+        with pytest.raises(ValueError, match="Measurement 1: Humidity"):
+            station.run_batch([(20.0, 50.0, 10.0), (25.0, 101.0, 12.0)])
+
+        assert observer.count == 0
+
+    def test_set_measurements_bulk(self, station: WeatherStation) -> None:
+        """Test that per-field sequences replay like run_batch."""
+        observer = RecordingObserver()
+        station.register_observer(observer)
+
+        station.set_measurements_bulk([20.0, 25.0], [50.0, 55.0], [10.0, 12.0])
+        assert observer.count == 2
+        assert observer.data == (25.0, 55.0, 12.0)
+
+        with pytest.raises(
+            ValueError, match="must have the same length, got 2, 1 and 2"
+        ):
+            station.set_measurements_bulk([20.0, 30.0], [50.0], [10.0, 12.0])
+        assert observer.count == 2
+
+
+class TestWeatherDisplay:
+    def test_display_output_format(
+        self, display: WeatherDisplay, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that display shows correct format without decimal points."""
+        display.update(Measurement(25.5, 65.3, 12.8))
+        output = capsys.readouterr().out
 
         # Should format as integers
-        self.assertIn("25°C", output)
-        self.assertIn("65%", output)
-        self.assertIn("12 km/h", output)
+        assert "25°C" in output
+        assert "65%" in output
+        assert "12 km/h" in output
         # Should NOT contain decimal points
-        self.assertNotIn("25.5", output)
-        self.assertNotIn("65.3", output)
+        assert "25.5" not in output
+        assert "65.3" not in output
 
-    def test_display_zero_values(self) -> None:
+    def test_display_zero_values(
+        self, display: WeatherDisplay, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test display with zero values."""
-        display = WeatherDisplay()
-
-        captured_output = StringIO()
-        sys.stdout = captured_output
-
-        display.update(0.0, 0.0, 0.0)
-
-        sys.stdout = sys.__stdout__
-        output = captured_output.getvalue()
-
-        self.assertIn("0°C", output)
-        self.assertIn("0%", output)
-        self.assertIn("0 km/h", output)
-
-
-class TestTemperatureAlert(unittest.TestCase):
-    def test_threshold_trigger(self) -> None:
-        """Test that temperature alert triggers above threshold."""
-        alert = TemperatureAlert(threshold=30.0)
-
-        captured_output = StringIO()
-        sys.stdout = captured_output
-
-        alert.update(29.0, 50, 10)
-        alert.update(31.0, 50, 10)
-
-        sys.stdout = sys.__stdout__
-        output = captured_output.getvalue()
-
-        self.assertIn("Alert! Temperature exceeded 30°C: 31°C", output)
-        self.assertNotIn("29°C", output)
-
-    def test_threshold_equality_no_alert(self) -> None:
-        """Test that alert doesn't trigger at exactly threshold."""
-        alert = TemperatureAlert(threshold=30.0)
-
-        captured_output = StringIO()
-        sys.stdout = captured_output
-
-        alert.update(30.0, 50, 10)
-
-        sys.stdout = sys.__stdout__
-        output = captured_output.getvalue()
-
-        self.assertEqual(output, "")
-
-    def test_default_random_threshold(self) -> None:
+        display.update(Measurement(0.0, 0.0, 0.0))
+        output = capsys.readouterr().out
+
+        assert "0°C" in output
+        assert "0%" in output
+        assert "0 km/h" in output
+
+
+class TestThresholdAlerts:
+    @pytest.mark.parametrize(
+        "alert, below, above, expected, unexpected",
+        [
+            (
+                TemperatureAlert(threshold=30.0),
+                (29.0, 50, 10),
+                (31.0, 50, 10),
+                "Alert! Temperature exceeded 30°C: 31°C",
+                "29°C",
+            ),
+            (
+                HumidityAlert(threshold=75.0),
+                (25, 74.0, 10),
+                (25, 76.0, 10),
+                "Alert! Humidity exceeded 75%: 76%",
+                "74%",
+            ),
+        ],
+    )
+    def test_threshold_trigger(
+        self,
+        alert: BaseThresholdAlert,
+        below: tuple[float, float, float],
+        above: tuple[float, float, float],
+        expected: str,
+        unexpected: str,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test that alerts trigger only once the threshold is crossed."""
+        alert.update(Measurement(*below))
+        alert.update(Measurement(*above))
+        output = capsys.readouterr().out
+
+        assert expected in output
+        assert unexpected not in output
+
+    @pytest.mark.parametrize(
+        "alert, measurements, expected",
+        [
+            # Temperature must exceed the threshold to alert
+            (TemperatureAlert(threshold=30.0), (30.0, 50, 10), ""),
+            # Humidity alerts as soon as it reaches the threshold
+            (
+                HumidityAlert(threshold=85.0),
+                (25, 85.0, 10),
+                "HumidityAlert: **Alert! Humidity exceeded 85%: 85%**\n",
+            ),
+        ],
+    )
+    def test_threshold_equality(
+        self,
+        alert: BaseThresholdAlert,
+        measurements: tuple[float, float, float],
+        expected: str,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test alert behavior at exactly the threshold."""
+        alert.update(Measurement(*measurements))
+        output = capsys.readouterr().out
+
+        assert output == expected
+
+    @pytest.mark.parametrize(
+        "alert_class, low, high",
+        [(TemperatureAlert, 25.0, 40.0), (HumidityAlert, 60.0, 90.0)],
+    )
+    def test_default_random_threshold(
+        self,
+        alert_class: type[TemperatureAlert] | type[HumidityAlert],
+        low: float,
+        high: float,
+    ) -> None:
         """Test that default threshold is within expected range."""
-        alert = TemperatureAlert()
-        self.assertGreaterEqual(alert._threshold, 25.0)
-        self.assertLessEqual(alert._threshold, 40.0)
-
-    def test_extreme_temperature_values(self) -> None:
-        """Test with extreme temperature values."""
+        alert = alert_class()
+        assert low <= alert._threshold <= high
+
+    @pytest.mark.parametrize(
+        "alert, measurements, expected",
+        [
+            (TemperatureAlert(threshold=30.0), (100.0, 50, 10), "100°C"),
+            (HumidityAlert(threshold=85.0), (25, 100.0, 10), "100%"),
+        ],
+    )
+    def test_extreme_values(
+        self,
+        alert: BaseThresholdAlert,
+        measurements: tuple[float, float, float],
+        expected: str,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test alerts with the maximum valid measurement."""
+        alert.update(Measurement(*measurements))
+        output = capsys.readouterr().out
+
+        assert expected in output
+
+    def test_fractional_value_truncated(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that alert messages show measurements without decimals."""
         alert = TemperatureAlert(threshold=30.0)
-
-        captured_output = StringIO()
-        sys.stdout = captured_output
-
-        alert.update(100.0, 50, 10)
-
-        sys.stdout = sys.__stdout__
-        output = captured_output.getvalue()
-
-        self.assertIn("100°C", output)
-
-
-class TestHumidityAlert(unittest.TestCase):
-    def test_threshold_trigger(self) -> None:
-        """Test that humidity alert triggers above threshold."""
-        alert = HumidityAlert(threshold=75.0)
-
-        captured_output = StringIO()
-        sys.stdout = captured_output
-
-        alert.update(25, 74.0, 10)
-        alert.update(25, 76.0, 10)
-
-        sys.stdout = sys.__stdout__
-        output = captured_output.getvalue()
-
-        self.assertIn("Alert! Humidity exceeded 75%: 76%", output)
-        self.assertNotIn("74%", output)
-
-    def test_threshold_equality_triggers_alert(self) -> None:
-        """Test that alert DOES trigger at exactly threshold."""
-        alert = HumidityAlert(threshold=85.0)
-
-        captured_output = StringIO()
-        sys.stdout = captured_output
-
-        alert.update(25, 85.0, 10)
-
-        sys.stdout = sys.__stdout__
-        output = captured_output.getvalue()
-
-        self.assertIn("Alert! Humidity exceeded 85%: 85%", output)
-
-    def test_default_random_threshold(self) -> None:
-        """Test that default threshold is within expected range."""
-        alert = HumidityAlert()
-        self.assertGreaterEqual(alert._threshold, 60.0)
-        self.assertLessEqual(alert._threshold, 90.0)
-
-    def test_extreme_humidity_values(self) -> None:
-        """Test with maximum humidity value."""
-        alert = HumidityAlert(threshold=85.0)
-
-        captured_output = StringIO()
-        sys.stdout = captured_output
-
-        alert.update(25, 100.0, 10)
-
-        sys.stdout = sys.__stdout__
-        output = captured_output.getvalue()
-
-        self.assertIn("100%", output)
-
-
-class TestWindSpeedAlert(unittest.TestCase):
-    def test_wind_speed_increase_alert(self) -> None:
+        alert.update(Measurement(31.7, 50, 10))
+        output = capsys.readouterr().out
+
+        assert "Alert! Temperature exceeded 30°C: 31°C" in output
+        assert "31.7" not in output
+
+    @pytest.mark.parametrize("alert_class", [TemperatureAlert, HumidityAlert])
+    @pytest.mark.parametrize("threshold", [float("inf"), float("nan")])
+    def test_non_finite_threshold_never_fires(
+        self,
+        alert_class: type[TemperatureAlert] | type[HumidityAlert],
+        threshold: float,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test that an infinite or NaN threshold constructs and stays silent."""
+        alert = alert_class(threshold=threshold)
+        alert.update(Measurement(100.0, 100.0, 10))
+
+        assert capsys.readouterr().out == ""
+
+
+class TestWindSpeedAlert:
+    def test_wind_speed_increase_alert(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test that the alert triggers only on increase."""
         alert = WindSpeedAlert()
-
-        captured_output = StringIO()
-        sys.stdout = captured_output
-
-        alert.update(20, 50, 10)
-        alert.update(20, 50, 15)
-        alert.update(20, 50, 12)
-
-        sys.stdout = sys.__stdout__
-        output = captured_output.getvalue()
-
-        self.assertIn("10 km/h → 15 km/h", output)
-        self.assertIn("No alert (No upward trend detected)", output)
-
-    def test_wind_speed_equal_no_alert(self) -> None:
-        """Test that equal wind speed prints 'no alert'."""
+        alert.update(Measurement(20, 50, 10))
+        alert.update(Measurement(20, 50, 15))
+        alert.update(Measurement(20, 50, 12))
+        output = capsys.readouterr().out
+
+        assert "10 km/h → 15 km/h" in output
+        assert "No alert (No upward trend detected)" in output
+
+    @pytest.mark.parametrize("wind_speed", [15, 0])
+    def test_unchanged_wind_speed_no_alert(
+        self, wind_speed: float, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that an unchanged wind speed prints 'no alert'."""
         alert = WindSpeedAlert()
+        alert.update(Measurement(20, 50, wind_speed))
+        alert.update(Measurement(20, 50, wind_speed))
+        output = capsys.readouterr().out
 
-        captured_output = StringIO()
-        sys.stdout = captured_output
+        assert "No alert" in output
 
-        alert.update(20, 50, 15)
-        alert.update(20, 50, 15)
-
-        sys.stdout = sys.__stdout__
-        output = captured_output.getvalue()
-
-        self.assertIn("No alert", output)
-
-    def test_first_update_no_output(self) -> None:
+    def test_first_update_no_output(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test that first update produces no output (no history)."""
         alert = WindSpeedAlert()
+        alert.update(Measurement(20, 50, 15))
+        output = capsys.readouterr().out
 
-        captured_output = StringIO()
-        sys.stdout = captured_output
-
-        alert.update(20, 50, 15)
-
-        sys.stdout = sys.__stdout__
-        output = captured_output.getvalue()
-
-        self.assertEqual(output, "")
+        assert output == ""
 
-    def test_continuous_increase(self) -> None:
+    def test_continuous_increase(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test multiple consecutive increases."""
         alert = WindSpeedAlert()
-
-        captured_output = StringIO()
-        sys.stdout = captured_output
-
-        alert.update(20, 50, 10)
-        alert.update(20, 50, 15)
-        alert.update(20, 50, 20)
-        alert.update(20, 50, 25)
-
-        sys.stdout = sys.__stdout__
-        output = captured_output.getvalue()
-
-        self.assertIn("10 km/h → 15 km/h", output)
-        self.assertIn("15 km/h → 20 km/h", output)
-        self.assertIn("20 km/h → 25 km/h", output)
-
-    def test_zero_wind_speed(self) -> None:
-        """Test with zero wind speed values."""
-        alert = WindSpeedAlert()
-
-        captured_output = StringIO()
-        sys.stdout = captured_output
-
-        alert.update(20, 50, 0)
-        alert.update(20, 50, 0)
-
-        sys.stdout = sys.__stdout__
-        output = captured_output.getvalue()
-
-        self.assertIn("No alert", output)
-
-
-class TestObserverFactory(unittest.TestCase):
-    def test_create_display(self) -> None:
-        """Test factory creates WeatherDisplay."""
-        observer = ObserverFactory.create_display()
-        self.assertIsInstance(observer, WeatherDisplay)
-
-    def test_create_temperature_alert_with_threshold(self) -> None:
-        """Test factory creates TemperatureAlert with specific threshold."""
-        observer = ObserverFactory.create_temperature_alert(threshold=30.0)
-        self.assertIsInstance(observer, TemperatureAlert)
-        self.assertEqual(observer._threshold, 30.0)
+        alert.update(Measurement(20, 50, 10))
+        alert.update(Measurement(20, 50, 15))
+        alert.update(Measurement(20, 50, 20))
+        alert.update(Measurement(20, 50, 25))
+        output = capsys.readouterr().out
+
+        assert "10 km/h → 15 km/h" in output
+        assert "15 km/h → 20 km/h" in output
+        assert "20 km/h → 25 km/h" in output
+
+
+class TestObserverFactory:
+    @pytest.mark.parametrize(
+        "create, expected_class",
+        [
+            (ObserverFactory.create_display, WeatherDisplay),
+            (ObserverFactory.create_temperature_alert, TemperatureAlert),
+            (ObserverFactory.create_humidity_alert, HumidityAlert),
+            (ObserverFactory.create_wind_speed_alert, WindSpeedAlert),
+        ],
+    )
+    def test_create_observer(
+        self, create: Callable[[], Observer], expected_class: type
+    ) -> None:
+        """Test factory creates each observer type."""
+        assert isinstance(create(), expected_class)
+
+    @pytest.mark.parametrize(
+        "create, threshold",
+        [
+            (ObserverFactory.create_temperature_alert, 30.0),
+            (ObserverFactory.create_humidity_alert, 75.0),
+        ],
+    )
+    def test_create_alert_with_threshold(
+        self, create: Callable[..., Observer], threshold: float
+    ) -> None:
+        """Test factory passes a specific threshold through."""
+        observer = create(threshold=threshold)
+        assert isinstance(observer, BaseThresholdAlert)
+        assert observer._threshold == threshold
 
     def test_create_temperature_alert_random_threshold(self) -> None:
         """Test factory creates TemperatureAlert with random threshold."""
         observer = ObserverFactory.create_temperature_alert()
-        self.assertIsInstance(observer, TemperatureAlert)
-        self.assertGreaterEqual(observer._threshold, 25.0)
-        self.assertLessEqual(observer._threshold, 40.0)
-
-    def test_create_humidity_alert(self) -> None:
-        """Test factory creates HumidityAlert."""
-        observer = ObserverFactory.create_humidity_alert(threshold=75.0)
-        self.assertIsInstance(observer, HumidityAlert)
-        self.assertEqual(observer._threshold, 75.0)
-
-    def test_create_wind_speed_alert(self) -> None:
-        """Test factory creates WindSpeedAlert."""
-        observer = ObserverFactory.create_wind_speed_alert()
-        self.assertIsInstance(observer, WindSpeedAlert)
+        assert isinstance(observer, TemperatureAlert)
+        assert 25.0 <= observer._threshold <= 40.0
 
     def test_create_all_alerts(self) -> None:
         """Test factory creates all alert types."""
         alerts = ObserverFactory.create_all_alerts()
-        self.assertEqual(len(alerts), 3)
-        self.assertIsInstance(alerts[0], TemperatureAlert)
-        self.assertIsInstance(alerts[1], WindSpeedAlert)
-        self.assertIsInstance(alerts[2], HumidityAlert)
+        assert [type(alert) for alert in alerts] == [
+            TemperatureAlert,
+            WindSpeedAlert,
+            HumidityAlert,
+        ]
 
     def test_create_default_observers(self) -> None:
         """Test factory creates default observer set."""
         observers = ObserverFactory.create_default_observers()
-        self.assertEqual(len(observers), 4)
-        self.assertIsInstance(observers[0], WeatherDisplay)
-
-
-class TestIntegration(unittest.TestCase):
-    def test_full_simulation_scenario(self) -> None:
+        assert len(observers) == 4
+        assert isinstance(observers[0], WeatherDisplay)
+
+    def test_default_observers_share_output_sink(
+        self, station: WeatherStation, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test a write callable routes every observer's output to one sink."""
+        lines: list[str] = []
+        for observer in ObserverFactory.create_default_observers(write=lines.append):
+            station.register_observer(observer)
+        station.set_measurements(35, 90, 10)
+        station.set_measurements(36, 91, 20)
+
+        assert capsys.readouterr().out == ""
+        assert lines[0].startswith("WeatherDisplay:")
+        assert (
+            "TemperatureAlert: **Alert! Temperature exceeded 32°C: 35°C**\n" in lines
+        )
+        assert "WindSpeedAlert: **Alert! Wind speed is increasing: " in lines[-2]
+        assert lines[-1] == "HumidityAlert: **Alert! Humidity exceeded 85%: 91%**\n"
+
+    def test_module_functions_back_factory_methods(self) -> None:
+        """Test ObserverFactory exposes the module-level factory functions."""
+        assert ObserverFactory.create_display is factory.create_display
+        assert ObserverFactory.create_all_alerts is factory.create_all_alerts
+
+
+class TestIntegration:
+    def test_full_simulation_scenario(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test a complete scenario with multiple observers."""
         station = WeatherStation()
         display = WeatherDisplay()
@@ -408,9 +659,6 @@ class TestIntegration(unittest.TestCase):
 
         station.register_observer(display)
 
-        captured_output = StringIO()
-        sys.stdout = captured_output
-
         # Week 1
         station.set_measurements(25.0, 60.0, 10.0)
 
@@ -422,42 +670,34 @@ class TestIntegration(unittest.TestCase):
         station.remove_observer(temp_alert)
         station.set_measurements(40.0, 70.0, 15.0)
 
-        sys.stdout = sys.__stdout__
-        output = captured_output.getvalue()
+        output = capsys.readouterr().out
 
         # Verify display appeared in all updates
-        self.assertEqual(output.count("WeatherDisplay"), 3)
+        assert output.count("WeatherDisplay") == 3
 
         # Verify temp alert only appeared in week 2
-        self.assertEqual(output.count("TemperatureAlert"), 1)
-        self.assertIn("35°C", output)
+        assert output.count("TemperatureAlert") == 1
+        assert "35°C" in output
 
     def test_observer_removal_stops_notifications(self) -> None:
         """Test that removed observers don't receive further updates."""
         station = WeatherStation()
 
-        class CountingObserver:
-            def __init__(self) -> None:
-                self.count = 0
-
-            def update(self, t: float, h: float, w: float) -> None:
-                self.count += 1
-
-        obs = CountingObserver()
+        obs = RecordingObserver()
         station.register_observer(obs)
 
         station.set_measurements(20, 50, 10)
-        self.assertEqual(obs.count, 1)
+        assert obs.count == 1
 
         station.set_measurements(25, 55, 12)
-        self.assertEqual(obs.count, 2)
+        assert obs.count == 2
 
         station.remove_observer(obs)
 
         station.set_measurements(30, 60, 15)
-        self.assertEqual(obs.count, 2)
+        assert obs.count == 2
 
-    def test_factory_with_station(self) -> None:
+    def test_factory_with_station(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test using factory to create and register observers."""
         station = WeatherStation()
 
@@ -468,17 +708,51 @@ class TestIntegration(unittest.TestCase):
         station.register_observer(display)
         station.register_observer(temp_alert)
 
-        captured_output = StringIO()
-        sys.stdout = captured_output
-
         station.set_measurements(35.0, 60.0, 15.0)
-
-        sys.stdout = sys.__stdout__
-        output = captured_output.getvalue()
-
-        self.assertIn("WeatherDisplay", output)
-        self.assertIn("TemperatureAlert", output)
-
-
-if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+        output = capsys.readouterr().out
+
+        assert "WeatherDisplay" in output
+        assert "TemperatureAlert" in output
+
+
+class TestSimulation:
+    def test_seeded_simulation_is_reproducible(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that the same seed produces the same simulation trace."""
+        run_simulation(weeks=10, seed=0)
+        first_output = capsys.readouterr().out
+
+        run_simulation(weeks=10, seed=0)
+        second_output = capsys.readouterr().out
+
+        assert first_output == second_output
+        assert first_output.count("---") == 10
+
+    def test_fixed_weeks_and_schedule(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test the fixed measurements and observer schedule of the first weeks."""
+        run_simulation(weeks=8, seed=0)
+        output = capsys.readouterr().out
+
+        assert output.startswith(
+            "Week 1:\n"
+            "WeatherDisplay: Showing Temperature = 28°C, Humidity = 70%, "
+            "Wind Speed = 12 km/h\n"
+            "---\n"
+        )
+        assert "Week 4:\nAdding: TemperatureAlert\n" in output
+        assert "Week 5:\nAdding: WindSpeedAlert\n" in output
+        assert "Week 6:\nAdding: HumidityAlert\n" in output
+        assert output.endswith("Removing: HumidityAlert\n---\n")
+
+    def test_direct_construction_matches_factory(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that both observer construction paths give the same trace."""
+        run_simulation(weeks=10, seed=1)
+        factory_output = capsys.readouterr().out
+
+        run_simulation(weeks=10, seed=1, use_factory=False)
+        direct_output = capsys.readouterr().out
+
+        assert factory_output == direct_output
@@ -1,6 +1,7 @@
 from typing import Optional
 from weather_monitoring.interfaces import Observer
 from weather_monitoring.observers import (
+    OutputSink,
     WeatherDisplay,
     TemperatureAlert,
     WindSpeedAlert,
@@ -8,89 +9,121 @@ from weather_monitoring.observers import (
 )
 
 
+def create_display(write: Optional[OutputSink] = None) -> Observer:
+    """
+    Create a weather display observer.
+
+    Args:
+        write: Callable receiving each output line, or None for stdout
+
+    Returns:
+        A new WeatherDisplay instance
+    """
+    return WeatherDisplay(write=write)
+
+
+def create_temperature_alert(
+    threshold: Optional[float] = None, write: Optional[OutputSink] = None
+) -> Observer:
+    """
+    Create a temperature alert observer.
+
+    Args:
+        threshold: Temperature threshold in Celsius, or None for random
+        write: Callable receiving each alert line, or None for stdout
+
+    Returns:
+        A new TemperatureAlert instance
+    """
+    return TemperatureAlert(threshold=threshold, write=write)
+
+
+def create_humidity_alert(
+    threshold: Optional[float] = None, write: Optional[OutputSink] = None
+) -> Observer:
+    """
+    Create a humidity alert observer.
+
+    Args:
+        threshold: Humidity threshold percentage, or None for random
+        write: Callable receiving each alert line, or None for stdout
+
+    Returns:
+        A new HumidityAlert instance
+    """
+    return HumidityAlert(threshold=threshold, write=write)
+
+
+def create_wind_speed_alert(write: Optional[OutputSink] = None) -> Observer:
+    """
+    Create a wind speed alert observer.
+
+    Args:
+        write: Callable receiving each output line, or None for stdout
+
+    Returns:
+        A new WindSpeedAlert instance
+    """
+    return WindSpeedAlert(write=write)
+
+
+def create_all_alerts(
+    temp_threshold: float = 32.0,
+    humidity_threshold: float = 85.0,
+    write: Optional[OutputSink] = None,
+) -> list[Observer]:
+    """
+    Create all alert observers with specified thresholds.
+
+    Args:
+        temp_threshold: Temperature threshold in Celsius
+        humidity_threshold: Humidity threshold percentage
+        write: Callable receiving each alert line, or None for stdout
+
+    Returns:
+        List containing all alert observer instances
+    """
+    return [
+        create_temperature_alert(threshold=temp_threshold, write=write),
+        create_wind_speed_alert(write=write),
+        create_humidity_alert(threshold=humidity_threshold, write=write),
+    ]
+
+
+def create_default_observers(write: Optional[OutputSink] = None) -> list[Observer]:
+    """
+    Create default set of observers for typical monitoring setup.
+
+    Args:
+        write: Callable receiving each output line, or None for stdout
+
+    Returns:
+        List containing display and all alert observers, with the same
+        thresholds as create_all_alerts()
+    """
+    return [
+        WeatherDisplay(write=write),
+        TemperatureAlert(threshold=32.0, write=write),
+        WindSpeedAlert(write=write),
+        HumidityAlert(threshold=85.0, write=write),
+    ]
+
+
 class ObserverFactory:
     """
     Factory class for creating weather observers.
-    
+
     This factory provides a centralized way to create observers with
     proper configuration, making it easier to manage observer creation
     and maintain consistency across the application.
+
+    The methods are the module-level factory functions, exposed here so
+    existing ObserverFactory.create_*() callers keep working.
     """
 
-    @staticmethod
-    def create_display() -> Observer:
-        """
-        Create a weather display observer.
-
-        Returns:
-            A new WeatherDisplay instance
-        """
-        return WeatherDisplay()
-
-    @staticmethod
-    def create_temperature_alert(threshold: Optional[float] = None) -> Observer:
-        """
-        Create a temperature alert observer.
-
-        Args:
-            threshold: Temperature threshold in Celsius, or None for random
-
-        Returns:
-            A new TemperatureAlert instance
-        """
-        return TemperatureAlert(threshold=threshold)
-
-    @staticmethod
-    def create_humidity_alert(threshold: Optional[float] = None) -> Observer:
-        """
-        Create a humidity alert observer.
-
-        Args:
-            threshold: Humidity threshold percentage, or None for random
-
-        Returns:
-            A new HumidityAlert instance
-        """
-        return HumidityAlert(threshold=threshold)
-
-    @staticmethod
-    def create_wind_speed_alert() -> Observer:
-        """
-        Create a wind speed alert observer.
-
-        Returns:
-            A new WindSpeedAlert instance
-        """
-        return WindSpeedAlert()
-
-    @staticmethod
-    def create_all_alerts(
-        temp_threshold: float = 32.0, humidity_threshold: float = 85.0
-    ) -> list[Observer]:
-        """
-        Create all alert observers with specified thresholds.
-
-        Args:
-            temp_threshold: Temperature threshold in Celsius
-            humidity_threshold: Humidity threshold percentage
-
-        Returns:
-            List containing all alert observer instances
-        """
-        return [
-            ObserverFactory.create_temperature_alert(threshold=temp_threshold),
-            ObserverFactory.create_wind_speed_alert(),
-            ObserverFactory.create_humidity_alert(threshold=humidity_threshold),
-        ]
-
-    @staticmethod
-    def create_default_observers() -> list[Observer]:
-        """
-        Create default set of observers for typical monitoring setup.
-
-        Returns:
-            List containing display and all alert observers
-        """
-        observers = [ObserverFactory.create_display()]
-        observers.extend(ObserverFactory.create_all_alerts())
-        return observers
\ No newline at end of file
+    create_display = staticmethod(create_display)
+    create_temperature_alert = staticmethod(create_temperature_alert)
+    create_humidity_alert = staticmethod(create_humidity_alert)
+    create_wind_speed_alert = staticmethod(create_wind_speed_alert)
+    create_all_alerts = staticmethod(create_all_alerts)
+    create_default_observers = staticmethod(create_default_observers)
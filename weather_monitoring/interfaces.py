@@ -1,19 +1,34 @@
-from typing import Protocol, runtime_checkable
+from typing import NamedTuple, Protocol
+
+
+class Measurement(NamedTuple):
+    """Immutable snapshot of the station's readings, shared by all observers."""
+
+    temperature: float
+    humidity: float
+    wind_speed: float
 
 
-@runtime_checkable
 class Observer(Protocol):
-    """Interface for any part of the system that needs to receive weather updates."""
+    """
+    Interface for any part of the system that needs to receive weather updates.
 
-    def update(
-        self, temperature: float, humidity: float, wind_speed: float
-    ) -> None: ...
+    An observer may also define an ``interests`` attribute: a frozenset of the
+    Measurement field names it reacts to. The station then only notifies it
+    when one of those fields changes. Observers without it receive every update.
+    """
+
+    # Empty slots keep __slots__ on implementing classes effective
+    __slots__ = ()
+
+    def update(self, measurement: Measurement) -> None: ...
 
 
-@runtime_checkable
 class Subject(Protocol):
     """Interface for the Weather Station."""
 
+    __slots__ = ()
+
     def register_observer(self, observer: Observer) -> None: ...
 
     def remove_observer(self, observer: Observer) -> None: ...
@@ -1,20 +1,51 @@
+import math
 import random
-from abc import ABC
+import sys
+from collections.abc import Callable
 from typing import Optional
-from weather_monitoring.interfaces import Observer
+from weather_monitoring.interfaces import Measurement, Observer
+
+# Private generator for random alert thresholds, bound once at import.
+# Scaling random() is cheaper than randrange() for drawing a single int.
+_random = random.Random().random
+
+# Receives each line of observer output, e.g. list.append to collect it
+OutputSink = Callable[[str], object]
+
+
+def _write_stdout(text: str) -> None:
+    # Look sys.stdout up per call so redirect_stdout() and capture still work
+    sys.stdout.write(text)
+
+
+# %d truncates each measurement to a whole number, like int() would
+_DISPLAY_FMT = (
+    "WeatherDisplay: Showing Temperature = %d°C, "
+    "Humidity = %d%%, Wind Speed = %d km/h\n"
+)
+_WIND_ALERT_FMT = (
+    "WindSpeedAlert: **Alert! Wind speed is increasing: %d km/h → %d km/h**\n"
+)
 
 
 class WeatherDisplay(Observer):
     """Simply displays the current weather data."""
 
-    def update(self, temperature: float, humidity: float, wind_speed: float) -> None:
-        print(
-            f"WeatherDisplay: Showing Temperature = {int(temperature)}°C, "
-            f"Humidity = {int(humidity)}%, Wind Speed = {int(wind_speed)} km/h"
-        )
+    __slots__ = ("_write",)
+
+    def __init__(self, write: Optional[OutputSink] = None) -> None:
+        """
+        Args:
+            write: Callable receiving each output line, or None for stdout
+        """
+        self._write: OutputSink = write if write is not None else _write_stdout
+
+    def update(self, measurement: Measurement) -> None:
+        # A Measurement is a tuple, so it fills the template directly
+        self._write(_DISPLAY_FMT % measurement)
 
 
-class BaseThresholdAlert(Observer, ABC):
+class BaseThresholdAlert(Observer):
     """
     Base class for threshold-based alerts.
     
@@ -22,8 +53,16 @@ class BaseThresholdAlert(Observer, ABC):
     when a measurement exceeds a threshold value.
     """
 
+    __slots__ = ("_threshold", "_alert_template", "_write")
+
     def __init__(
-        self, threshold: Optional[float], min_threshold: int, max_threshold: int
+        self,
+        threshold: Optional[float],
+        min_threshold: int,
+        max_threshold: int,
+        alert_type: str,
+        unit: str,
+        write: Optional[OutputSink] = None,
     ) -> None:
         """
         Initialize alert with threshold.
@@ -32,71 +71,107 @@ class BaseThresholdAlert(Observer, ABC):
             threshold: Specific threshold value, or None for random
             min_threshold: Minimum value for random threshold
             max_threshold: Maximum value for random threshold
+            alert_type: Type of alert (e.g., "Temperature", "Humidity")
+            unit: Unit of measurement (e.g., "°C", "%")
+            write: Callable receiving each alert line, or None for stdout
         """
+        self._write: OutputSink = write if write is not None else _write_stdout
+        # A random threshold stays an int; it compares with float readings
+        # directly, so no float() conversion is needed
         self._threshold: float = (
             threshold
             if threshold is not None
-            else float(random.randint(min_threshold, max_threshold))
+            else min_threshold
+            + int(_random() * (max_threshold - min_threshold + 1))
         )
-
-    def _format_alert(
-        self, alert_type: str, value: float, unit: str, use_gte: bool = False
-    ) -> str:
-        """
-        Format an alert message.
-
-        Args:
-            alert_type: Type of alert (e.g., "Temperature", "Humidity")
-            value: Current value that triggered the alert
-            unit: Unit of measurement (e.g., "°C", "%")
-            use_gte: Whether threshold check uses >= instead of >
-
-        Returns:
-            Formatted alert message string
-        """
-        comparison = "exceeded" if not use_gte else "exceeded"
-        return (
-            f"{alert_type}Alert: **Alert! {alert_type} {comparison} "
-            f"{int(self._threshold)}{unit}: {int(value)}{unit}**"
+        # Everything but the measured value is fixed, so build the message once.
+        # %d truncates the value like int() does, without a separate call.
+        # An infinite or NaN threshold has no int() form, so it is shown as is.
+        threshold_text = (
+            int(self._threshold) if math.isfinite(self._threshold) else self._threshold
+        )
+        unit = unit.replace("%", "%%")
+        self._alert_template: str = (
+            f"{alert_type}Alert: **Alert! {alert_type} exceeded "
+            f"{threshold_text}{unit}: %d{unit}**\n"
         )
 
 
 class TemperatureAlert(BaseThresholdAlert):
     """Alerts if temperature exceeds a threshold."""
 
-    def __init__(self, threshold: Optional[float] = None) -> None:
-        super().__init__(threshold, min_threshold=25, max_threshold=40)
+    __slots__ = ()
+    # Only a new temperature reading can change whether this alert fires
+    interests = frozenset({"temperature"})
+
+    def __init__(
+        self,
+        threshold: Optional[float] = None,
+        write: Optional[OutputSink] = None,
+    ) -> None:
+        super().__init__(
+            threshold,
+            min_threshold=25,
+            max_threshold=40,
+            alert_type="Temperature",
+            unit="°C",
+            write=write,
+        )
 
-    def update(self, temperature: float, humidity: float, wind_speed: float) -> None:
+    def update(self, measurement: Measurement) -> None:
+        temperature = measurement.temperature
         if temperature > self._threshold:
-            print(self._format_alert("Temperature", temperature, "°C"))
+            self._write(self._alert_template % temperature)
 
 
 class HumidityAlert(BaseThresholdAlert):
     """Alerts if humidity exceeds or equals a threshold."""
 
-    def __init__(self, threshold: Optional[float] = None) -> None:
-        super().__init__(threshold, min_threshold=60, max_threshold=90)
+    __slots__ = ()
+    # Only a new humidity reading can change whether this alert fires
+    interests = frozenset({"humidity"})
+
+    def __init__(
+        self,
+        threshold: Optional[float] = None,
+        write: Optional[OutputSink] = None,
+    ) -> None:
+        super().__init__(
+            threshold,
+            min_threshold=60,
+            max_threshold=90,
+            alert_type="Humidity",
+            unit="%",
+            write=write,
+        )
 
-    def update(self, temperature: float, humidity: float, wind_speed: float) -> None:
+    def update(self, measurement: Measurement) -> None:
+        humidity = measurement.humidity
         if humidity >= self._threshold:
-            print(self._format_alert("Humidity", humidity, "%", use_gte=True))
+            self._write(self._alert_template % humidity)
 
 
 class WindSpeedAlert(Observer):
     """Alerts if there is an upward trend in wind speed."""
 
-    def __init__(self) -> None:
-        self._last_wind_speed: Optional[float] = None
+    __slots__ = ("_last_wind_speed", "_write")
 
-    def update(self, temperature: float, humidity: float, wind_speed: float) -> None:
-        if self._last_wind_speed is not None:
-            if wind_speed > self._last_wind_speed:
-                print(
-                    f"WindSpeedAlert: **Alert! Wind speed is increasing: "
-                    f"{int(self._last_wind_speed)} km/h → {int(wind_speed)} km/h**"
-                )
-            else:
-                print("WindSpeedAlert: No alert (No upward trend detected)")
-
-        self._last_wind_speed = wind_speed
\ No newline at end of file
+    def __init__(self, write: Optional[OutputSink] = None) -> None:
+        """
+        Args:
+            write: Callable receiving each output line, or None for stdout
+        """
+        self._write: OutputSink = write if write is not None else _write_stdout
+        # NaN compares false against everything, so it stands in for "no
+        # previous reading" without a separate None check on every update
+        self._last_wind_speed: float = math.nan
+
+    def update(self, measurement: Measurement) -> None:
+        wind_speed = measurement.wind_speed
+        last_wind_speed = self._last_wind_speed
+        self._last_wind_speed = wind_speed
+        if wind_speed > last_wind_speed:
+            self._write(_WIND_ALERT_FMT % (last_wind_speed, wind_speed))
+        elif last_wind_speed == last_wind_speed:
+            # Only false for the NaN sentinel, i.e. on the first reading
+            self._write("WindSpeedAlert: No alert (No upward trend detected)\n")
\ No newline at end of file
@@ -1,5 +1,12 @@
-from typing import List
-from weather_monitoring.interfaces import Observer, Subject
+from collections.abc import Callable, Iterable
+from typing import Optional
+
+from weather_monitoring.interfaces import Measurement, Observer, Subject
+
+# A registered observer's id() key, cached update() and interests (None for all)
+_Dispatch = tuple[
+    tuple[int, Callable[[Measurement], None], Optional[frozenset[str]]], ...
+]
 
 
 class WeatherStation(Subject):
@@ -11,10 +18,17 @@ class WeatherStation(Subject):
     observers whenever the measurements are updated.
 
     Attributes:
-        _observers: List of registered observers that receive notifications
-        _temperature: Current temperature in Celsius
-        _humidity: Current humidity percentage
-        _wind_speed: Current wind speed in km/h
+        _callbacks: Bound update() methods of registered observers, keyed by the
+            observer's id() and kept in registration order
+        _interests: Measurement fields each observer reacts to, keyed like
+            _callbacks; observers that declare no interests are absent
+        _dispatch: Snapshot of the registered observers that notifications
+            iterate, rebuilt after the registrations change
+        _pending: Keys of observers registered since the last notification,
+            which have not yet received the current measurements
+        _measurement: Current temperature (Celsius), humidity (%) and wind
+            speed (km/h), kept as the snapshot handed to observers
+        _has_measurements: Whether any measurements have been set yet
 
     Example:
         >>> station = WeatherStation()
@@ -24,12 +38,23 @@ class WeatherStation(Subject):
         WeatherDisplay: Showing Temperature = 25°C, Humidity = 60%, Wind Speed = 15 km/h
     """
 
+    __slots__ = (
+        "_callbacks",
+        "_interests",
+        "_dispatch",
+        "_pending",
+        "_measurement",
+        "_has_measurements",
+    )
+
     def __init__(self) -> None:
-        """Initialize the weather station with empty observer list and zero measurements."""
-        self._observers: List[Observer] = []
-        self._temperature: float = 0.0
-        self._humidity: float = 0.0
-        self._wind_speed: float = 0.0
+        """Initialize the weather station with no observers and zero measurements."""
+        self._callbacks: dict[int, Callable[[Measurement], None]] = {}
+        self._interests: dict[int, frozenset[str]] = {}
+        self._dispatch: Optional[_Dispatch] = None
+        self._pending: set[int] = set()
+        self._measurement: Measurement = Measurement(0.0, 0.0, 0.0)
+        self._has_measurements: bool = False
 
     def register_observer(self, observer: Observer) -> None:
         """
@@ -38,11 +63,28 @@ class WeatherStation(Subject):
         Args:
             observer: The observer to register. Must implement Observer interface.
 
+        Raises:
+            TypeError: If the observer's interests is a single string rather
+                than a collection of field names.
+            ValueError: If the observer's interests name a field that
+                Measurement does not have.
+
         Note:
             If the observer is already registered, this method has no effect.
+            An observer with an ``interests`` attribute is only notified of
+            changes to those Measurement fields.
         """
-        if observer not in self._observers:
-            self._observers.append(observer)
+        key = id(observer)
+        if key in self._callbacks:
+            return
+        interests = getattr(observer, "interests", None)
+        if interests is not None:
+            interests = self._validate_interests(interests)
+            self._interests[key] = interests
+        # Resolve update() once here rather than on every notification
+        self._callbacks[key] = observer.update
+        self._dispatch = None
+        self._pending.add(key)
 
     def remove_observer(self, observer: Observer) -> None:
         """
@@ -54,21 +96,39 @@ class WeatherStation(Subject):
         Note:
             If the observer is not registered, this method has no effect.
         """
-        if observer in self._observers:
-            self._observers.remove(observer)
+        if self._callbacks.pop(id(observer), None) is not None:
+            self._interests.pop(id(observer), None)
+            self._dispatch = None
+            self._pending.discard(id(observer))
 
     def notify_observers(self) -> None:
         """
         Notify all registered observers of the current weather measurements.
 
         This method calls the update() method on each registered observer,
-        passing the current temperature, humidity, and wind speed.
+        passing one Measurement snapshot shared by all of them.
+
+        Note:
+            Observers may register or remove observers from inside update().
+            An observer removed mid-pass is not called for the rest of it; one
+            registered mid-pass is first notified on the next notification.
         """
-        for observer in self._observers:
-            observer.update(self._temperature, self._humidity, self._wind_speed)
+        callbacks = self._callbacks
+        if not callbacks:
+            return
+        self._pending = set()
+        # The snapshot is built once per change and reused on every notification
+        measurement = self._measurement
+        for key, callback, _ in self._dispatch_snapshot():
+            if callbacks.get(key) is callback:
+                callback(measurement)
 
     def set_measurements(
-        self, temperature: float, humidity: float, wind_speed: float
+        self,
+        temperature: float,
+        humidity: float,
+        wind_speed: float,
+        force: bool = False,
     ) -> None:
         """
         Update weather measurements and notify all observers.
@@ -77,18 +137,201 @@ class WeatherStation(Subject):
             temperature: Temperature in Celsius (must be between -100 and 100)
             humidity: Humidity as a percentage (must be between 0 and 100)
             wind_speed: Wind speed in km/h (must be non-negative)
+            force: Notify observers even if the measurements are unchanged
 
         Raises:
             ValueError: If any measurement is outside valid range.
 
         Note:
-            This method automatically triggers notification to all observers.
+            This method automatically triggers notification to all observers
+            unless the measurements equal the current ones, in which case only
+            observers registered since the last notification receive them.
+        """
+        # One fused range check on the common path; the detailed per-field
+        # check only runs to build the error message for invalid input
+        if not (
+            -100 <= temperature <= 100 and 0 <= humidity <= 100 and wind_speed >= 0
+        ):
+            self._validate_measurements(temperature, humidity, wind_speed)
+        self._apply_measurements(temperature, humidity, wind_speed, force)
+
+    def run_batch(
+        self,
+        measurements: Iterable[tuple[float, float, float]],
+        force: bool = False,
+    ) -> None:
+        """
+        Replay a sequence of measurements, notifying observers for each one.
+
+        Every measurement is validated before the first notification, so an
+        invalid entry leaves the station and its observers untouched.
+
+        Args:
+            measurements: (temperature, humidity, wind_speed) tuples in order
+            force: Notify observers even for entries equal to the previous one
+
+        Raises:
+            ValueError: If any measurement is outside valid range. The message
+                includes the index of the offending entry.
+        """
+        batch = list(measurements)
+        for index, (temperature, humidity, wind_speed) in enumerate(batch):
+            try:
+                self._validate_measurements(temperature, humidity, wind_speed)
+            except ValueError as error:
+                raise ValueError(f"Measurement {index}: {error}") from error
+
+        for temperature, humidity, wind_speed in batch:
+            self._apply_measurements(temperature, humidity, wind_speed, force)
+
+    def set_measurements_bulk(
+        self,
+        temperatures: Iterable[float],
+        humidities: Iterable[float],
+        wind_speeds: Iterable[float],
+        force: bool = False,
+    ) -> None:
+        """
+        Replay measurements given as one sequence per field.
+
+        Equivalent to run_batch() over the zipped sequences, so every entry is
+        validated before observers are notified of the first one.
+
+        Args:
+            temperatures: Temperatures in Celsius, in order
+            humidities: Humidity percentages, in order
+            wind_speeds: Wind speeds in km/h, in order
+            force: Notify observers even for entries equal to the previous one
+
+        Raises:
+            ValueError: If the sequences differ in length, or any measurement
+                is outside valid range.
+        """
+        temperatures = list(temperatures)
+        humidities = list(humidities)
+        wind_speeds = list(wind_speeds)
+        if not len(temperatures) == len(humidities) == len(wind_speeds):
+            raise ValueError(
+                "temperatures, humidities and wind_speeds must have the same "
+                f"length, got {len(temperatures)}, {len(humidities)} "
+                f"and {len(wind_speeds)}"
+            )
+        self.run_batch(zip(temperatures, humidities, wind_speeds, strict=True), force)
+
+    def _apply_measurements(
+        self, temperature: float, humidity: float, wind_speed: float, force: bool
+    ) -> None:
+        """
+        Store validated measurements and notify observers if they changed.
+
+        Args:
+            temperature: Temperature in Celsius
+            humidity: Humidity percentage
+            wind_speed: Wind speed in km/h
+            force: Notify observers even if the measurements are unchanged
+        """
+        measurement = Measurement(temperature, humidity, wind_speed)
+        previous = self._measurement
+        filtered = not force and self._has_measurements
+        # A repeated reading carries no new information for observers,
+        # except those registered since the last notification
+        if filtered and measurement == previous:
+            if self._pending:
+                self._notify_pending()
+            return
+        self._measurement = measurement
+        self._has_measurements = True
+        # Skip the notification call entirely while nobody is listening
+        if not self._callbacks:
+            return
+        if filtered and self._interests:
+            changed = frozenset(
+                field
+                for field, old, new in zip(
+                    Measurement._fields, previous, measurement, strict=True
+                )
+                if old != new
+            )
+            self._notify_interested(changed)
+        else:
+            self.notify_observers()
+
+    def _notify_interested(self, changed: frozenset[str]) -> None:
+        """
+        Notify the observers whose interests overlap the changed fields.
+
+        Observers registered since the last notification never saw the
+        previous reading, so they are notified regardless of their interests.
+
+        Args:
+            changed: Names of the Measurement fields that changed
         """
-        self._validate_measurements(temperature, humidity, wind_speed)
-        self._temperature = temperature
-        self._humidity = humidity
-        self._wind_speed = wind_speed
-        self.notify_observers()
+        pending, self._pending = self._pending, set()
+        callbacks = self._callbacks
+        measurement = self._measurement
+        for key, callback, wanted in self._dispatch_snapshot():
+            if callbacks.get(key) is not callback:
+                continue
+            if wanted is None or key in pending or not wanted.isdisjoint(changed):
+                callback(measurement)
+
+    def _notify_pending(self) -> None:
+        """Notify only the observers registered since the last notification."""
+        # Swap the set out first so registrations made during dispatch stay pending
+        pending, self._pending = self._pending, set()
+        callbacks = self._callbacks
+        measurement = self._measurement
+        for key, callback, _ in self._dispatch_snapshot():
+            if key in pending and callbacks.get(key) is callback:
+                callback(measurement)
+
+    def _dispatch_snapshot(self) -> _Dispatch:
+        """
+        Return the registered observers as an immutable snapshot.
+
+        The snapshot is cached until the next register or remove, so
+        notifications neither copy the registry nor break when an observer
+        changes it mid-dispatch. Callers skip entries whose callback is no
+        longer the registered one: register_observer() binds a fresh update()
+        method, so this catches observers removed, or removed and registered
+        again, during the pass.
+        """
+        dispatch = self._dispatch
+        if dispatch is None:
+            interests = self._interests
+            dispatch = self._dispatch = tuple(
+                (key, callback, interests.get(key))
+                for key, callback in self._callbacks.items()
+            )
+        return dispatch
+
+    def _validate_interests(self, interests: Iterable[str]) -> frozenset[str]:
+        """
+        Validate an observer's interests against the Measurement fields.
+
+        Args:
+            interests: Names of the Measurement fields the observer reacts to
+
+        Returns:
+            The interests as a frozenset
+
+        Raises:
+            TypeError: If interests is a single string.
+            ValueError: If interests names an unknown field.
+        """
+        # frozenset("temperature") would silently become a set of letters
+        if isinstance(interests, str):
+            raise TypeError(
+                f"Interests must be a collection of field names, got {interests!r}"
+            )
+        interests = frozenset(interests)
+        unknown = interests.difference(Measurement._fields)
+        if unknown:
+            raise ValueError(
+                f"Unknown measurement fields in interests: {sorted(unknown)}, "
+                f"expected some of {list(Measurement._fields)}"
+            )
+        return interests
 
     def _validate_measurements(
         self, temperature: float, humidity: float, wind_speed: float